@@ -23,19 +23,24 @@ the Free Software Foundation, either version 3 of the License, or
 ###############################################################################
 
 # Standard library imports
+import io
 import os
 import sys
-import csv
+import json
+import hashlib
+import re
 import time
+import threading
 import shutil
-from typing import Dict, List, Optional, Union
+import functools
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
-# Third-party imports
-import yaml
-import array
-import pyvisa
+# Third-party imports; pyvisa, yaml and PIL are imported on first use
 import logging
-from PIL import Image, ImageDraw, ImageFont
+if TYPE_CHECKING:
+    import pyvisa
 from PySide6.QtWidgets import (
     QWidget,
     QApplication,
@@ -43,8 +48,7 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QAbstractItemView,
     QLineEdit,
     QFileDialog,
     QMessageBox,
@@ -55,19 +59,37 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import (
     QPixmap,
     QImage,
+    QImageReader,
     QIcon,
+    QIntValidator,
     QPainter
 )
 from PySide6.QtCore import (
     Qt,
+    QAbstractTableModel,
+    QModelIndex,
+    QBuffer,
+    QByteArray,
     QTimer,
     QFile,
     QSize,
     QTranslator,
-    QLocale
+    QLocale,
+    QLibraryInfo,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    Signal
 )
 from PySide6.QtUiTools import QUiLoader
 
+# Translations compiled into a Qt resource by build.py (pyside6-rcc), only
+# present in the built executable; otherwise the .qm files are loaded from disk
+try:
+    import translations_rc  # noqa: F401
+except ImportError:
+    translations_rc = None
+
 def get_file_inside_exe(file_name):
     return os.path.join(os.path.dirname(__file__), file_name)
 
@@ -109,23 +131,55 @@ def load_translations(app, locale_name=None):
 
     logging.info(f"Loading translations for {locale_name}")
     
-    # Remove any existing translators
+    # Remove any existing translators, they are parented to app and would pile up
     for translator in app.findChildren(QTranslator):
         app.removeTranslator(translator)
+        translator.deleteLater()
     
     translator = QTranslator(app)
-    translation_file = f"resources/translations/pythonscreenshot_{locale_name}.qm"
+    # the compiled resource first, then the .qm file on disk
+    loaded = translations_rc is not None and translator.load(f":/translations/pythonscreenshot_{locale_name}.qm")
+    if not loaded:
+        loaded = translator.load(get_file_inside_exe(f"resources/translations/pythonscreenshot_{locale_name}.qm"))
     
-    if translator.load(get_file_inside_exe(translation_file)):
+    if loaded:
         app.installTranslator(translator)
         logging.info(f"Loaded translations for {locale_name}")
     else:
         logging.warning(f"Could not load translations for {locale_name}")
+    
+    # Qt's own strings (standard dialog buttons etc.) come with PySide6
+    qt_translator = QTranslator(app)
+    if qt_translator.load(f"qtbase_{locale_name}", QLibraryInfo.path(QLibraryInfo.TranslationsPath)):
+        app.installTranslator(qt_translator)
 
 # Constants
 SCREENSHOT_EXTENSIONS = ['.PNG', '.BMP', '.JPG']
 DEFAULT_CHUNK_SIZE = 8000
+SCREENSHOT_CHUNK_SIZE = 1 << 20  # 1 MiB reads for screenshot transfers
 DEFAULT_TIMEOUT = 30000
+RESIZE_DEBOUNCE_MS = 30
+AUTO_REFRESH_MIN_MS = 200
+AUTO_REFRESH_MAX_MS = 10000
+ERROR_REPEAT_S = 1.0  # an identical error within this time is not shown again
+# queries answered with a binary block (screenshots etc.), case-insensitive
+BINARY_QUERY_RE = re.compile(r'BMP|SNAP\?|HCOP|DUMP|DATA\?', re.IGNORECASE)
+# extension of saved query data per matched keyword, most modern scopes
+# answer HCOP/DUMP/DATA? with PNG; other replies are saved as .dat
+QUERY_DATA_EXTENSIONS = {'BMP': '.bmp', 'HCOP': '.png', 'DUMP': '.png', 'DATA?': '.png'}
+# Save dialog filters: (accepted extensions, Qt image format, Qt quality).
+# Qt maps PNG quality to zlib level (100 - quality) * 9 / 91, so 85 is
+# level 1, a fast deflate without writing an uncompressed file. BMP has
+# no quality setting, -1 keeps Qt's default.
+SAVE_FILTERS = {
+    "PNG Files (*.png)": (('.png',), "PNG", 85),
+    "JPEG Files (*.jpg)": (('.jpg', '.jpeg'), "JPEG", 95),
+    "BMP Files (*.bmp)": (('.bmp',), "BMP", -1),
+}
+DEFAULT_SAVE_FILTER = "PNG Files (*.png)"
+COL_NAME, COL_TYPE, COL_MANUFACTURER, COL_VISA_ID = 0, 1, 2, 3  # instrument table columns
+TEXT_SCREENSHOT_BACKGROUND = (73, 109, 137)  # canvas colour for forged screenshots
+TEXT_SCREENSHOT_FOREGROUND = (255, 255, 0)   # text colour for forged screenshots
 INSTRUMENTS_CSV = get_file_near_exe('config/PythonScreenShotInstruments.CSV')
 SCREENSHOT_CONFIG = get_file_near_exe('config/instrument_screenshots.yaml')
 VERSION_CONFIG = get_file_inside_exe('config/version.yaml')
@@ -135,12 +189,33 @@ SCREENSHOT_DIR = get_file_near_exe("screenshots")  # Directory to store screensh
 os.makedirs(SCREENSHOT_DIR, exist_ok=True)
 
 # Global variables
-rm = pyvisa.ResourceManager()
+_rm = None
+_rm_lock = threading.Lock()
+
+def get_resource_manager():
+    """Get the shared pyvisa ResourceManager, creating it on first use"""
+    global _rm
+    with _rm_lock:
+        if _rm is None:
+            # importing pyvisa and opening the manager probes the VISA
+            # backends, which is left out of the startup path
+            import pyvisa
+            _rm = pyvisa.ResourceManager()
+    return _rm
 
 # *************************************************************************** #
 # Utility classes                                                             #
 # *************************************************************************** #
 
+@contextmanager
+def wait_cursor():
+    """Show the wait cursor for the duration of the block, restoring it on errors"""
+    QApplication.setOverrideCursor(Qt.WaitCursor)
+    try:
+        yield
+    finally:
+        QApplication.restoreOverrideCursor()
+
 class FileManager:
     """Handles file operations"""
     
@@ -152,16 +227,107 @@ class FileManager:
             logging.info(f"Deleted file: {file_name}")
     
     @staticmethod
-    def write_binary_file(data: Union[bytes, bytearray], file_name: str):
-        """Write binary data to file"""
+    def write_binary_file(data: Union[bytes, bytearray, memoryview], file_name: str, fsync: bool = False):
+        """Write binary data to a temporary file and move it into place"""
+        tmp_name = file_name + '.tmp'
         try:
-            with open(file_name, 'wb') as f:
+            with open(tmp_name, 'wb') as f:
                 f.write(data)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            # readers never see a half-written screenshot
+            os.replace(tmp_name, file_name)
             logging.info(f"Successfully wrote data to: {file_name}")
         except Exception as e:
             logging.error(f"Error writing file {file_name}: {str(e)}")
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
             raise
 
+    @staticmethod
+    def save_image(image: QImage, file_name: str, image_format: str, quality: int = -1) -> str:
+        """Encode an image to file, flattening transparency onto white for JPEG"""
+        # opaque sources (nearly all screenshots) are encoded as they are;
+        # convertToFormat() alone would turn transparent pixels black
+        if image_format == "JPEG" and image.hasAlphaChannel():
+            flat_image = QImage(image.size(), QImage.Format_RGB32)
+            flat_image.fill(Qt.white)
+            painter = QPainter(flat_image)
+            painter.drawImage(0, 0, image)
+            painter.end()
+            image = flat_image
+        if not image.save(file_name, image_format, quality):
+            raise OSError(f"Could not save image to {file_name}")
+        logging.info(f"Saved image to: {file_name}")
+        return file_name
+
+    @staticmethod
+    def convert_image(source_file: str, file_name: str, image_format: str, quality: int = -1) -> str:
+        """Decode an image file and save it in another format"""
+        image = QImage(source_file)
+        if image.isNull():
+            raise OSError(f"Could not read image {source_file}")
+        return FileManager.save_image(image, file_name, image_format, quality)
+
+def _read_json_sidecar(cache_path: str, mtime_ns: int):
+    """Return the data of a JSON sidecar if it was written for this mtime"""
+    try:
+        with open(cache_path, 'r') as f:
+            cache = json.load(f)
+        if cache.get('mtime_ns') == mtime_ns:
+            return cache['data']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    return None
+
+def _write_json_sidecar(cache_path: str, mtime_ns: int, data) -> None:
+    """Atomically write parsed data to a JSON sidecar"""
+    try:
+        # only cache data that survives the JSON round trip unchanged
+        if json.loads(json.dumps(data)) != data:
+            return
+        tmp_name = cache_path + '.tmp'
+        with open(tmp_name, 'w') as f:
+            json.dump({'mtime_ns': mtime_ns, 'data': data}, f)
+        os.replace(tmp_name, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        # the config directory may be read-only inside a compiled build
+        logging.debug(f"Could not write config cache {cache_path}: {e}")
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime_ns: int):
+    """Parse a YAML file, cached until its modification time changes"""
+    # a JSON sidecar next to the file spares the YAML parse on later startups
+    cache_path = path + '.json'
+    data = _read_json_sidecar(cache_path, mtime_ns)
+    if data is None:
+        import yaml
+        # Use the libyaml C loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(path, 'r') as f:
+            data = yaml.load(f, Loader=loader)
+        _write_json_sidecar(cache_path, mtime_ns, data)
+    return data
+
+def load_yaml(path: str):
+    """Load a YAML file, reusing the parsed result while the file is unchanged"""
+    return _load_yaml_cached(path, os.stat(path).st_mtime_ns)
+
+@functools.lru_cache(maxsize=8)
+def _load_csv_cached(path: str, mtime_ns: int) -> Dict[str, str]:
+    """Parse a two column ';' separated file, cached until it changes"""
+    # plain "INSTRUMENT;TYPE" lines without quoting, skip the header; a line
+    # without ';' maps to an empty type instead of failing the whole file
+    with open(path, 'r') as csv_file:
+        next(csv_file)
+        rows = (line.rstrip('\r\n').partition(';') for line in csv_file if line.strip())
+        return {name: instr_type for name, _, instr_type in rows}
+
+def load_csv(path: str) -> Dict[str, str]:
+    """Load a two column CSV file, reusing the parsed result while it is unchanged"""
+    return _load_csv_cached(path, os.stat(path).st_mtime_ns)
+
 class VersionManager:
     """Manages application version information"""
     _instance = None
@@ -175,9 +341,7 @@ class VersionManager:
     def _load_version_info(self) -> None:
         """Load version information from YAML file"""
         try:
-            
-            with open(VERSION_CONFIG, 'r') as f:
-                self.version_info = yaml.safe_load(f)
+            self.version_info = load_yaml(VERSION_CONFIG)
             logging.debug(f"Loaded version info from {VERSION_CONFIG}")
         except Exception as e:
             logging.error(f"Error loading version info: {e}", exc_info=True)
@@ -191,12 +355,14 @@ class VersionManager:
             }
             logging.warning("Using default version info due to loading error")
     
-    @property
+    # version_info is loaded once per process, so the formatted strings are
+    # built on first access and kept for later language switches
+    @functools.cached_property
     def version_string(self) -> str:
         """Get formatted version string"""
         return f"V{self.version_info['version']} {self.version_info['release_date']}"
     
-    @property
+    @functools.cached_property
     def window_title(self) -> str:
         """Get formatted window title"""
         return (f"{self.version_info['author']} {self.version_info['app_name']} GUI "
@@ -205,34 +371,35 @@ class VersionManager:
 
 class InstrumentManager:
     """Manages instrument configurations and types"""
-    def __init__(self):
-        self.instrument_types: Dict[str, str] = {}
-        self.screenshot_config: Dict[str, dict] = {}
-        self._load_instrument_types()
-        self._load_screenshot_config()
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(InstrumentManager, cls).__new__(cls)
+            cls._instance.instrument_types = {}
+            cls._instance.screenshot_config = {}
+            cls._instance._load_instrument_types()
+            cls._instance._load_screenshot_config()
+        return cls._instance
 
     def _load_instrument_types(self) -> None:
         """Load instrument types from CSV file"""
         try:
-            name_list = []
-            type_list = []
-            with open(INSTRUMENTS_CSV, 'r', newline='') as csv_file:
-                reader = csv.reader(csv_file, delimiter=';')
-                headers = next(reader)
-                for row in reader:
-                    name_list.append(row[0])
-                    type_list.append(row[1])
-            self.instrument_types = dict(zip(name_list, type_list))
-        except Exception as e:
-            print(f"Error loading instrument types: {e}")
+            self.instrument_types = load_csv(INSTRUMENTS_CSV)
+        except Exception:
+            logging.exception("Error loading instrument types")
 
     def _load_screenshot_config(self) -> None:
         """Load screenshot configuration from YAML file"""
         try:
-            with open(SCREENSHOT_CONFIG, 'r') as f:
-                self.screenshot_config = yaml.safe_load(f)
-        except Exception as e:
-            print(f"Error loading screenshot config: {e}")
+            self.screenshot_config = load_yaml(SCREENSHOT_CONFIG)
+        except Exception:
+            logging.exception("Error loading screenshot config")
+
+    def reload(self) -> None:
+        """Pick up edited config files; unchanged files are not parsed again"""
+        self._load_instrument_types()
+        self._load_screenshot_config()
 
     def get_instrument_type(self, instr_name: str) -> str:
         """Get instrument type from instrument name"""
@@ -242,64 +409,132 @@ class InstrumentManager:
         """Get screenshot configuration for instrument type"""
         return self.screenshot_config.get(instr_type)
 
+# Open VISA sessions keyed by VISA ID, shared by all SCPI traffic
+_resource_cache: Dict[str, 'pyvisa.resources.MessageBasedResource'] = {}
+# *IDN? replies of the cached sessions, valid as long as the session is open
+_resource_idn: Dict[str, str] = {}
+
+def _get_resource(visa_id: str):
+    """Get the VISA session for an instrument, opening it on first use"""
+    instr = _resource_cache.get(visa_id)
+    if instr is None:
+        instr = get_resource_manager().open_resource(visa_id, chunk_size=DEFAULT_CHUNK_SIZE, timeout=DEFAULT_TIMEOUT)
+        _resource_cache[visa_id] = instr
+    return instr
+
+def _drop_resource(visa_id: str) -> None:
+    """Forget a session after an error, so the next call opens a fresh one"""
+    instr = _resource_cache.pop(visa_id, None)
+    _resource_idn.pop(visa_id, None)
+    if instr is not None:
+        try:
+            instr.close()
+        except Exception:
+            pass
+
+@functools.lru_cache(maxsize=32)
+def encode_commands(commands: tuple, termination: str, encoding: str) -> tuple:
+    """Encode SCPI commands with their termination once for write_raw()"""
+    return tuple((cmd + termination).encode(encoding) for cmd in commands)
+
+def close_all_resources() -> None:
+    """Close all cached VISA sessions and the resource manager, called when the application quits"""
+    global _rm
+    for visa_id in list(_resource_cache):
+        _drop_resource(visa_id)
+    with _rm_lock:
+        if _rm is not None:
+            _rm.close()
+            _rm = None
+
 class InstrumentCommunicator:
     """Handles communication with instruments"""
     @staticmethod
     def send_command(visa_id: str, command: str) -> str:
         """Send a SCPI command to instrument"""
         try:
-            instr = rm.open_resource(visa_id, chunk_size=DEFAULT_CHUNK_SIZE, timeout=DEFAULT_TIMEOUT)
+            instr = _get_resource(visa_id)
             instr.write(command)
             return 'OK'
-        except Exception as e:
-            print(f"Error sending command: {e}")
+        except Exception:
+            logging.exception("Error sending command")
+            _drop_resource(visa_id)
             return 'ERROR'
 
     @staticmethod
-    def send_query(visa_id: str, command: str) -> str:
+    def send_query(visa_id: str, command: str) -> Union[str, memoryview, bytes]:
         """Send a SCPI query to instrument"""
         try:
-            instr = rm.open_resource(visa_id, chunk_size=DEFAULT_CHUNK_SIZE, timeout=DEFAULT_TIMEOUT)
+            instr = _get_resource(visa_id)
             # Check if this is a binary data query (screenshots, etc.)
-            cmd_upper = command.upper()
-            is_binary = any(x in cmd_upper for x in ['BMP', 'SNAP?', 'HCOP', 'DUMP', 'DATA?', 'DISP:DATA?'])
-            
-            if is_binary:
+            if BINARY_QUERY_RE.search(command):
                 instr.write(command)
                 result = instr.read_raw()
                 # Handle IEEE 488.2 binary block format
                 if result.startswith(b'#'):
                     # Skip the '#' and read the length of the size field
-                    num_digits = int(chr(result[1]))
-                    # Skip the header (#9xxxxxxxxx) and get the actual data
+                    num_digits = result[1] - 0x30
+                    # Skip the header (#9xxxxxxxxx); a memoryview slice avoids
+                    # copying the whole payload just to drop a few bytes
                     header_size = 2 + num_digits  # 2 for '#9', and then the digits
-                    result = result[header_size:]
+                    result = memoryview(result)[header_size:]
             else:
                 result = instr.query(command, delay=0.5)
             return result
-        except Exception as e:
-            print(f"Error sending query: {e}")
+        except Exception:
+            logging.exception("Error sending query")
+            _drop_resource(visa_id)
             return ''
 
+    @staticmethod
+    def read_binary_block(instr, command: str, delay: float = 0) -> bytes:
+        """Query an IEEE 488.2 definite length block and return its payload"""
+        from pyvisa.constants import StatusCode
+        instr.write(command)
+        if delay:
+            time.sleep(delay)
+        header = instr.read_bytes(2)
+        # '#' followed by one ASCII digit, the digit is read as a plain byte
+        num_digits = header[1] - 0x30 if len(header) == 2 else -1
+        if header[:1] != b'#' or not 0 <= num_digits <= 9:
+            raise ValueError(f"Invalid binary block header: {header!r}")
+        if num_digits == 0:
+            # indefinite length block, the payload runs up to the terminator
+            data = instr.read_raw()
+            return data[:-1] if data.endswith(b'\n') else data
+        size = int(instr.read_bytes(num_digits))
+        data = instr.read_bytes(size)
+        # drain whatever terminator follows (LF, CR+LF) unless END came
+        # with the last data byte, so nothing is left in the cached session
+        if instr.last_status == StatusCode.success_max_count_read:
+            instr.read_raw()
+        return data
+
     @staticmethod
     def get_visa_resources() -> List[str]:
         """Get list of available VISA resources"""
         try:
             # get all VISA resources
+            rm = get_resource_manager()
             resourceList = rm.list_resources()
             visaList = []
             
             # check each resource if it is a SCPI resource
-            for resource in resourceList:
+            for resource in dict.fromkeys(resourceList):
+                if resource in _resource_idn:
+                    # already identified over an open session
+                    visaList.append(resource)
+                    continue
                 try:
                     instr = rm.open_resource(resource)
                     instr.write('*IDN?')
                     visaList.append(resource)
-                except:
-                    pass
+                except Exception as e:
+                    logging.debug(f"{resource} is not a SCPI resource: {e}")
                     
             return visaList
-        except:
+        except Exception:
+            logging.exception("Error listing VISA resources")
             return []
 
 # *************************************************************************** #
@@ -310,10 +545,34 @@ class InstrumentCommunicator:
 # get a screenshot depending on instrument type class                         #
 # =========================================================================== #
 def GetScreenShot(instrType, visaId):
-    """Get screenshot from instrument using YAML configuration"""
+    """Get screenshot from instrument and save it, return the file name or ''"""
+    data, fileType = GetScreenShotData(instrType, visaId)
+    if data is None:
+        return ''
+    return SaveScreenShotData(data, fileType)
+
+# =========================================================================== #
+# save captured screenshot data with a timestamped file name                  #
+# =========================================================================== #
+def SaveScreenShotData(data, fileType):
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    filename = os.path.join(SCREENSHOT_DIR, f'SCREENSHOT_{timestamp}.{fileType}')
+    logging.info(f"Saving screenshot to: {filename}")
+    FileManager.write_binary_file(data, filename)
+    return filename
+
+# =========================================================================== #
+# read the screenshot data of an instrument, nothing is written to disk       #
+# =========================================================================== #
+def GetScreenShotData(instrType, visaId):
+    """Get screenshot data from instrument using YAML configuration
+
+    Returns (data, file type), or (None, None) if the instrument has no screenshot support.
+    """
     logging.info(f"Getting screenshot for instrument type: {instrType}, VISA ID: {visaId}")
     
     instrument_manager = InstrumentManager()
+    instrument_manager.reload()
     config = instrument_manager.get_screenshot_config(instrType)
     
     if config is None:
@@ -322,29 +581,31 @@ def GetScreenShot(instrType, visaId):
         if 'DL1DWG' in instrType:
             try:
                 logging.info("Attempting Arduino device screenshot")
-                instr = rm.open_resource(visaId, chunk_size=DEFAULT_CHUNK_SIZE, timeout=DEFAULT_TIMEOUT)
-                result = GetArDeviceScreenShot(instr)
-                timestamp = time.strftime("%Y%m%d_%H%M%S")
-                filename = os.path.join(SCREENSHOT_DIR, f'SCREENSHOT_{timestamp}.PNG')
-                FileManager.write_binary_file(result, filename)
-                return filename
+                instr = _get_resource(visaId)
+                return GetArDeviceScreenShot(instr), 'PNG'
             except Exception as e:
                 logging.error(f"Error getting Arduino screenshot: {e}")
-                return ''
-        return ''
+                return None, None
+        return None, None
 
+    instr = None
     try:
         # Connect to instrument
         logging.info(f"Connecting to instrument: {visaId}")
-        instr = rm.open_resource(visaId, chunk_size=DEFAULT_CHUNK_SIZE, timeout=DEFAULT_TIMEOUT)
+        instr = _get_resource(visaId)
+        # large chunks cut per-chunk overhead on TCP/USB, serial keeps the default
+        chunk_size = DEFAULT_CHUNK_SIZE if visaId.startswith('ASRL') else SCREENSHOT_CHUNK_SIZE
+        instr.chunk_size = chunk_size
         
-        # Execute pre-commands
-        for cmd in config.get('commands', []):
+        # Execute pre-commands, encoded once per configuration and session settings
+        commands = tuple(config.get('commands', []))
+        for cmd, cmdBytes in zip(commands, encode_commands(commands, instr.write_termination, instr.encoding)):
             logging.info(f"Executing pre-command: {cmd}")
-            InstrumentCommunicator.send_command(visaId, cmd)
+            instr.write_raw(cmdBytes)
         
         # Get screenshot data
         if config['query_type'] == 'binary_values':
+            import array
             params = config.get('binary_params', {})
             datatype = params.get('datatype', 'B')
             container = params.get('container', 'bytearray')
@@ -362,71 +623,137 @@ def GetScreenShot(instrType, visaId):
                     container = array
             
             logging.debug(f"Executing query command: {config['query_command']}")
-            result = instr.query_binary_values(
-                config['query_command'],
-                datatype=datatype,
-                container=container,
-                delay=delay
-            )
-            if isinstance(result, bytearray):
-                result = bytes(result)
+            if datatype == 'B':
+                # raw bytes need no unpacking, read the block payload directly
+                result = InstrumentCommunicator.read_binary_block(
+                    instr,
+                    config['query_command'],
+                    delay=delay
+                )
+            else:
+                result = instr.query_binary_values(
+                    config['query_command'],
+                    datatype=datatype,
+                    container=container,
+                    delay=delay,
+                    chunk_size=chunk_size
+                )
+            # bytes/bytearray are written as-is; other containers are packed
+            # once and written through a view instead of a tobytes() copy
+            if not isinstance(result, (bytes, bytearray)):
+                result = memoryview(array.array(datatype, result))
         else:  # read_raw
             logging.info("Using read_raw to get screenshot data")
-            result = instr.read_raw()
+            result = instr.read_raw(chunk_size)
         
-        # Determine filename with timestamp and save
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        filename = os.path.join(SCREENSHOT_DIR, f'SCREENSHOT_{timestamp}.{config["file_type"]}')
-        logging.info(f"Saving screenshot to: {filename}")
-        FileManager.write_binary_file(result, filename)
-        return filename
+        return result, config["file_type"]
         
     except Exception as e:
         logging.error(f"Error getting screenshot: {str(e)}", exc_info=True)
+        _drop_resource(visaId)
+        instr = None
         raise
+    finally:
+        # small control-plane reads go back to the default chunk size
+        if instr is not None:
+            instr.chunk_size = DEFAULT_CHUNK_SIZE
+
+# =========================================================================== #
+# hash captured screenshot data to detect an unchanged screen                 #
+# =========================================================================== #
+def GetScreenShotDigest(data):
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+# =========================================================================== #
+# decode screenshot data in memory, downscaled to about targetSize            #
+# =========================================================================== #
+def LoadScreenShotImage(data, targetSize):
+    buffer = QBuffer()
+    buffer.setData(QByteArray(bytes(data) if isinstance(data, memoryview) else data))
+    buffer.open(QBuffer.ReadOnly)
+    reader = QImageReader(buffer)
+    imageSize = reader.size()
+    if imageSize.isValid() and imageSize.width() > targetSize.width():
+        reader.setScaledSize(imageSize.scaled(targetSize, Qt.KeepAspectRatio))
+    return reader.read()
+
+# =========================================================================== #
+# capture and decode a screenshot, safe to run off the GUI thread             #
+# =========================================================================== #
+def CaptureScreenShotImage(instrType, visaId, targetSize, lastDigest=None):
+    """Capture a screenshot and return (file name, digest, QImage)
+
+    The file name is '' if nothing was captured and None if the content
+    equals lastDigest; an unchanged screen is neither saved nor decoded.
+    Only the auto refresh timer passes lastDigest; Run and Get Screen
+    clicks are always saved.
+    New data is saved for doSave, but decoded from memory.
+    """
+    data, fileType = GetScreenShotData(instrType, visaId)
+    if data is None:
+        return '', None, None
+    digest = GetScreenShotDigest(data)
+    if digest == lastDigest:
+        return None, digest, None
+    fileName = SaveScreenShotData(data, fileType)
+    return fileName, digest, LoadScreenShotImage(data, targetSize)
 
 # =========================================================================== #
 # specialized screenshot routines for a device class go here                  #
 # =========================================================================== #
 
+# --------------------------------------------------------------------------- #
+# load a TrueType font once per (path, size) for the forged screenshots       #
+# --------------------------------------------------------------------------- #
+@functools.lru_cache(maxsize=8)
+def GetScreenShotFont(fontPath, fontSize):
+    from PIL import ImageFont
+    return ImageFont.truetype(fontPath, fontSize)
+
+# --------------------------------------------------------------------------- #
+# encode a forged screenshot as PNG data for GetScreenShotData                #
+# --------------------------------------------------------------------------- #
+def EncodeScreenShotImage(img):
+    pngData = io.BytesIO()
+    img.save(pngData, 'PNG', compress_level=1)
+    return pngData.getvalue()
+
 # --------------------------------------------------------------------------- #
 # get a screenshot from an ARDUINO SCPI device with a virtual display         #
 # --------------------------------------------------------------------------- #
 def GetArDeviceScreenShot(instr):
 
+    # PIL is only needed for the forged screenshots, import it on demand
+    from PIL import Image, ImageDraw
+
     # how many lines to read ?
     noOfLines = int(instr.query('*NLINES?',delay=0.2))
     
-    # read all the lines
-    lineList = []
-    for i in range(noOfLines):
-        scpiCommand = '*LTEXT? ' + str(i+1)
-        lineReceived = instr.query(scpiCommand,delay=0.2).rstrip('\n').rstrip('\r')
-        lineList.append(lineReceived)
+    # read all the lines; the device is awake after *NLINES?, so the lines
+    # are read back to back, query() still waits for each complete reply
+    lineList = [instr.query('*LTEXT? ' + str(i+1)).rstrip('\r\n')
+                for i in range(noOfLines)]
         
     # OK, now we need to create a bitmap from the text. check line length
-    maxLen = 0
-    for i in range(noOfLines):
-        maxLen = max(maxLen,len(lineList[i]))
+    maxLen = max(map(len, lineList), default=0)
 
     # some fitting heuristics
     fontSize  = 64
     imgSizeX  = int(maxLen * fontSize * 0.75) + 20
     imgSizeY  = int(noOfLines * fontSize * 1.3)
-    textFont  = ImageFont.truetype(get_file_inside_exe('resources/fonts/PythonScreenShotFont.ttf'),fontSize)
+    textFont  = GetScreenShotFont(get_file_inside_exe('resources/fonts/PythonScreenShotFont.ttf'),fontSize)
     
     # create image and draw space, set origin    
-    img       = Image.new('RGB', (imgSizeX,imgSizeY), color = (73, 109, 137))
+    img       = Image.new('RGB', (imgSizeX,imgSizeY), color = TEXT_SCREENSHOT_BACKGROUND)
     drawSpace = ImageDraw.Draw(img)
     dOriginX  = 20
     dOriginY  = 20
     
-    # write the text, adjust line spacing
-    for i in range(noOfLines):
-        drawSpace.text((dOriginX,dOriginY + int(i*fontSize*1.2)),lineList[i],font=textFont,fill=(255,255,0))
+    # write the text in one call, adjust line spacing
+    drawSpace.multiline_text((dOriginX,dOriginY),'\n'.join(lineList),font=textFont,fill=TEXT_SCREENSHOT_FOREGROUND,spacing=int(fontSize*0.2))
 
-    # save image
-    img.save('SCREENSHOT.PNG')
+    # encode image; two flat colours compress well even at the fastest level
+    return EncodeScreenShotImage(img)
 
 # --------------------------------------------------------------------------- #
 # forge a screenshot for a RIGOL DP832 power supply - not needed anymore      #
@@ -435,22 +762,20 @@ def GetArDeviceScreenShot(instr):
 # --------------------------------------------------------------------------- #
 def GetRigolDP832DeviceScreenShot(instr):
 
-    # collect the status of all channels
-    statusList      = []
-    setVoltageList  = []
-    setCurrentList  = []
-    msrVoltageList  = []
-    msrCurrentList  = []
-    msrPowerList    = []
-    for i in range(3):
-      statusList.append(instr.query('OUTP? CH' + str(i+1),delay=0.2).rstrip('\n').rstrip('\r')) 
-      result = instr.query('APPL? CH' + str(i+1),delay=0.2).rstrip('\n').rstrip('\r').split(',')
-      setVoltageList.append(float(result[1]))
-      setCurrentList.append(float(result[2]))
-      result = instr.query('MEAS:ALL? CH' + str(i+1),delay=0.2).rstrip('\n').rstrip('\r').split(',')
-      msrVoltageList.append(float(result[0]))
-      msrCurrentList.append(float(result[1]))
-      msrPowerList.append(float(result[2]))
+    from PIL import Image, ImageDraw
+
+    # collect the status of all channels, one compound query per quantity
+    # so the instrument answers all three channels in a single round-trip
+    def queryAllChannels(query):
+        compoundQuery = ';:'.join(query + ' CH' + str(i+1) for i in range(3))
+        return instr.query(compoundQuery,delay=0.2).rstrip('\r\n').split(';')
+
+    # zip(*...) turns the per-channel replies into per-quantity columns
+    statusList      = queryAllChannels('OUTP?')
+    setVoltageList, setCurrentList = zip(*(map(float, reply.split(',')[1:3])
+                                           for reply in queryAllChannels('APPL?')))
+    msrVoltageList, msrCurrentList, msrPowerList = zip(*(map(float, reply.split(',')[:3])
+                                                         for reply in queryAllChannels('MEAS:ALL?')))
 
     # OK, now we need to create a bitmap with some fitting heuristics
     fontSize  = 64
@@ -458,47 +783,59 @@ def GetRigolDP832DeviceScreenShot(instr):
     noOfLines = 7
     imgSizeX  = int(maxLen * fontSize * 0.75) + 20
     imgSizeY  = int(noOfLines * fontSize * 1.3)
-    textFont  = ImageFont.truetype(get_file_inside_exe('resources/fonts/PythonScreenShotFont.ttf'),fontSize)
+    textFont  = GetScreenShotFont(get_file_inside_exe('resources/fonts/PythonScreenShotFont.ttf'),fontSize)
     
     # create image and draw space, set origin    
-    img       = Image.new('RGB', (imgSizeX,imgSizeY), color = (73, 109, 137))
+    img       = Image.new('RGB', (imgSizeX,imgSizeY), color = TEXT_SCREENSHOT_BACKGROUND)
     drawSpace = ImageDraw.Draw(img)
     dOriginX  = 20
     dOriginY  = 20
     dBlockShift = 5
     
-    # write the text, adjust line spacing
+    # one row per quantity: vertical offset of the row and its text per channel
+    rowList = [
+        (0,                lambda i: ' CH' + str(i+1)),
+        (1*fontSize,       lambda i: ' ' + statusList[i]),
+        (2*fontSize + 30,  lambda i: str(round(setVoltageList[i],3)) + 'V'),
+        (3*fontSize + 30,  lambda i: str(round(setCurrentList[i],3)) + 'A'),
+        (4*fontSize + 60,  lambda i: str(round(msrVoltageList[i],3)) + 'V'),
+        (5*fontSize + 60,  lambda i: str(round(msrCurrentList[i],3)) + 'A'),
+        (6*fontSize + 90,  lambda i: str(round(msrPowerList[i],3))   + 'W'),
+    ]
+
+    # write the text, the grouped rows keep their own gaps so each line is
+    # placed explicitly instead of one multiline_text call per channel
     for i in range(3):
-        drawSpace.text((dOriginX + int(i*dBlockShift*fontSize),dOriginY)             ,' CH' + str(i+1)                          ,font=textFont,fill=(255,255,0))
-        drawSpace.text((dOriginX + int(i*dBlockShift*fontSize),dOriginY + 1*fontSize),' ' + statusList[i]                       ,font=textFont,fill=(255,255,0))
-        drawSpace.text((dOriginX + int(i*dBlockShift*fontSize),dOriginY + 2*fontSize +30),str(round(setVoltageList[i],3)) + 'V' ,font=textFont,fill=(255,255,0))
-        drawSpace.text((dOriginX + int(i*dBlockShift*fontSize),dOriginY + 3*fontSize +30),str(round(setCurrentList[i],3)) + 'A' ,font=textFont,fill=(255,255,0))
-        drawSpace.text((dOriginX + int(i*dBlockShift*fontSize),dOriginY + 4*fontSize +60),str(round(msrVoltageList[i],3)) + 'V' ,font=textFont,fill=(255,255,0))
-        drawSpace.text((dOriginX + int(i*dBlockShift*fontSize),dOriginY + 5*fontSize +60),str(round(msrCurrentList[i],3)) + 'A' ,font=textFont,fill=(255,255,0))
-        drawSpace.text((dOriginX + int(i*dBlockShift*fontSize),dOriginY + 6*fontSize +90),str(round(msrPowerList[i],3))   + 'W' ,font=textFont,fill=(255,255,0))
-    # save image
-    img.save('SCREENSHOT.PNG')
+        blockX = dOriginX + int(i*dBlockShift*fontSize)
+        for rowOffset, rowText in rowList:
+            drawSpace.text((blockX,dOriginY + rowOffset),rowText(i),font=textFont,fill=TEXT_SCREENSHOT_FOREGROUND)
+    # encode image
+    return EncodeScreenShotImage(img)
 
 # --------------------------------------------------------------------------- #
 # forge a screenshot for a Keysight U2004A Power Sensor                       #
 # --------------------------------------------------------------------------- #
 def GetKeysightU2004ADeviceScreenShot(instr):
 
+    from PIL import Image, ImageDraw
+
     # this is a special part full of bugs and timeouts.
     try:
         instr.write('*CLS')
         instr.write(':INIT:CONT ON')
         time.sleep(1)        
         result = float(instr.query(':FETCH?',delay=1))
-    except:
+    except Exception:
         # try again. this behaviour could be due to an autocalibration 
         try:
             instr.write('*CLS')
             instr.write(':INIT:CONT ON')
             time.sleep(1)
             result = float(instr.query(':FETCH?',delay=1))
-        except:
-            pass
+        except Exception:
+            # without a reading there is nothing to paint
+            logging.exception("U2004A did not return a reading")
+            raise
 
     # OK, now we need to create a bitmap with some fitting heuristics
     fontSize  = 64
@@ -506,19 +843,19 @@ def GetKeysightU2004ADeviceScreenShot(instr):
     noOfLines = 1
     imgSizeX  = int(maxLen * fontSize * 0.75) + 20
     imgSizeY  = int(noOfLines * fontSize * 1.3)
-    textFont  = ImageFont.truetype(get_file_inside_exe('resources/fonts/PythonScreenShotFont.ttf'),fontSize)
+    textFont  = GetScreenShotFont(get_file_inside_exe('resources/fonts/PythonScreenShotFont.ttf'),fontSize)
     
     # create image and draw space, set origin    
-    img       = Image.new('RGB', (imgSizeX,imgSizeY), color = (73, 109, 137))
+    img       = Image.new('RGB', (imgSizeX,imgSizeY), color = TEXT_SCREENSHOT_BACKGROUND)
     drawSpace = ImageDraw.Draw(img)
     dOriginX  = 20
     dOriginY  = 20
     
     # write the text
-    drawSpace.text((dOriginX,dOriginY),str(round(result,5)) + ' dBm',font=textFont,fill=(255,255,0))
+    drawSpace.text((dOriginX,dOriginY),str(round(result,5)) + ' dBm',font=textFont,fill=TEXT_SCREENSHOT_FOREGROUND)
     
-    # save image
-    img.save('SCREENSHOT.PNG')
+    # encode image
+    return EncodeScreenShotImage(img)
 
 # =========================================================================== #
 # VISA routines go here                                                       #
@@ -529,34 +866,56 @@ def GetKeysightU2004ADeviceScreenShot(instr):
 # --------------------------------------------------------------------------- #
 def GetVisaSCPIResources(optional_ip_address=None, network_timeout=10000):
 
-    # enumerate all resources VISA finds
-    rm                  = pyvisa.ResourceManager()
-    resourceList        = rm.list_resources()
+    # enumerate all resources VISA finds through the shared resource manager,
+    # so the probed sessions stay open for later commands
+    # some backends report the same resource twice, probe each only once
+    rm                  = get_resource_manager()
+    resourceList        = list(dict.fromkeys(rm.list_resources()))
     availableVisaIdList = []
     availableNameList   = []
     seen_resources = set()  # Track seen resources to prevent duplicates
 
-    # go thru this list and ask an *IDN? to see what instrument it is
-    for i in range(len(resourceList)):
-        resourceReply = ''
+    # ask an *IDN? to see what instrument it is
+    def probeResource(resource):
+        if resource in _resource_idn:                   # identified before
+            return _resource_idn[resource]
         try:
-            if (resourceList[i][:4] == 'ASRL'):         # serial resource
-                instrument          = rm.open_resource(resourceList[i],
+            if resource in _resource_cache:             # already connected
+                instrument          = _resource_cache[resource]
+            elif resource.startswith('ASRL'):           # serial resource
+                instrument          = rm.open_resource(resource,
                                                         timeout=2000,
                                                         access_mode=1)
                 # instrument.lock_excl()
-                resourceReply       = instrument.query('*IDN?').upper()
             else:
-                instrument          = rm.open_resource(resourceList[i])
-                resourceReply       = instrument.query('*IDN?').upper()
-            
-            # Only add if we haven't seen this device before
-            if (resourceReply != '' and resourceReply not in seen_resources):
-                seen_resources.add(resourceReply)
-                availableVisaIdList.append(resourceList[i])
-                availableNameList.append(resourceReply)
-        except:
-            pass
+                instrument          = rm.open_resource(resource)
+            resourceReply           = instrument.query('*IDN?').upper()
+        except Exception as e:
+            # not every VISA resource is a SCPI instrument, this is expected
+            logging.debug(f"No *IDN? reply from {resource}: {e}")
+            _drop_resource(resource)
+            return ''
+        # keep the session for later commands with the usual settings
+        instrument.timeout    = DEFAULT_TIMEOUT
+        instrument.chunk_size = DEFAULT_CHUNK_SIZE
+        _resource_cache[resource] = instrument
+        _resource_idn[resource]   = resourceReply
+        return resourceReply
+
+    # probe all resources concurrently, so the total wait is the slowest
+    # probe instead of the sum of all timeouts; map() keeps the VISA order
+    if resourceList:
+        with ThreadPoolExecutor(max_workers=min(8, len(resourceList))) as executor:
+            replyList = list(executor.map(probeResource, resourceList))
+    else:
+        replyList = []
+
+    for resource, resourceReply in zip(resourceList, replyList):
+        # Only add if we haven't seen this device before
+        if (resourceReply != '' and resourceReply not in seen_resources):
+            seen_resources.add(resourceReply)
+            availableVisaIdList.append(resource)
+            availableNameList.append(resourceReply)
 
     if optional_ip_address:
         if "TCPIP" not in optional_ip_address:
@@ -579,12 +938,13 @@ def GetVisaSCPIResources(optional_ip_address=None, network_timeout=10000):
 def SendScpiCommand(visaId,commandString):
 
     # first connect to the instrument
-    instr = rm.open_resource(visaId,chunk_size=DEFAULT_CHUNK_SIZE,timeout=DEFAULT_TIMEOUT)
+    instr = _get_resource(visaId)
 
     try:
         instr.write(commandString)
         return 'OK'
-    except:
+    except Exception:
+        logging.exception("Error sending SCPI command")
         return 'SCPI Error'
 
 # --------------------------------------------------------------------------- #
@@ -593,32 +953,159 @@ def SendScpiCommand(visaId,commandString):
 def SendScpiQuery(visaId,commandString):
 
     # first connect to the instrument
-    instr = rm.open_resource(visaId,chunk_size=DEFAULT_CHUNK_SIZE,timeout=DEFAULT_TIMEOUT)
+    instr = _get_resource(visaId)
 
     try:
         result = instr.query(commandString,delay=0.5)
         return result
-    except:
+    except Exception:
+        logging.exception("Error sending SCPI query")
         return 'SCPI Error'
 
 # *************************************************************************** #
 # GUI code starts here                                                        #
 # *************************************************************************** #
+class InstrumentTableModel(QAbstractTableModel):
+    """Read-only table of the found instruments, one list per column"""
+    HEADERS = ["Name", "Description", "Manufacturer", "VISA ID"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.columns = [[], [], [], []]  # indexed by COL_NAME .. COL_VISA_ID
+
+    def setInstruments(self, names, types, mfgs, visaIds):
+        """Replace all rows at once"""
+        self.beginResetModel()
+        self.columns = [names, types, mfgs, visaIds]
+        self.endResetModel()
+
+    def instrument(self, row):
+        """Get (name, type, VISA ID) of a row"""
+        return (self.columns[COL_NAME][row],
+                self.columns[COL_TYPE][row],
+                self.columns[COL_VISA_ID][row])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns[COL_NAME])
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self.columns[index.column()][index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return QApplication.translate("PythonScreenShot", self.HEADERS[section])
+        return super().headerData(section, orientation, role)
+
+class WorkerSignals(QObject):
+    """Signals of a Worker, delivered to slots on the GUI thread"""
+    finished = Signal(object)
+    error = Signal(str)
+
+class Worker(QRunnable):
+    """Runs a callable on the global QThreadPool"""
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            logging.error(f"Background task failed: {str(e)}", exc_info=True)
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+    def start(self, pool=None):
+        """Queue this worker on the given pool, or the global thread pool"""
+        if pool is None:
+            pool = QThreadPool.globalInstance()
+        pool.start(self)
+
 class PythonScreenShot(QWidget):
     """Main application window"""
+    # (widget in the .ui file, untranslated text) refreshed by update_translations
+    TRANSLATED_TEXTS = (
+        ("headerTopS", "PYTHON SCPI SCREENSHOT"),
+        ("doFindButton", "Find Instruments"),
+        ("doRefreshButton", "Get Screen"),
+        ("doAutoRefreshButton", "Auto Refresh"),
+        ("doSaveButton", "Save to ..."),
+        ("doSendClearButton", "Clear Error"),
+        ("doSendResetButton", "Send Reset"),
+        ("doGetLastErrorButton", "Get Last Error"),
+        ("doRunButton", "Send Run"),
+        ("doSendCommandButton", "Send Command"),
+        ("labelStatic", "Available VISA Instruments"),
+        ("labelAutoRefPeriod", "Auto Refresh Period (ms)"),
+        ("labelScpiCommand", "SCPI Command Text"),
+        ("labelScpiReplyStatic", "Last SCPI Reply"),
+        ("binaryData", "Bin"),
+    )
+    _scpiDinoPixMap = None  # decoded once per process, see scpiDinoPixMap()
+    _blankPixMap = None  # white startup placeholder, see blankPixMap()
+
+    @classmethod
+    def scpiDinoPixMap(cls) -> QPixmap:
+        """Get the SCPI dino logo, loading it on first use"""
+        if cls._scpiDinoPixMap is None:
+            cls._scpiDinoPixMap = QPixmap(get_file_inside_exe('resources/images/SCPILogoDinosaur.png'))
+        return cls._scpiDinoPixMap
+
+    @classmethod
+    def blankPixMap(cls) -> QPixmap:
+        """Get the white placeholder shown before the first screenshot, filled on first use"""
+        if cls._blankPixMap is None:
+            cls._blankPixMap = QPixmap(1024, 800)
+            cls._blankPixMap.fill(Qt.white)
+        return cls._blankPixMap
+
     def __init__(self):
         super().__init__()
         self.version_manager = VersionManager()
+        self.instrument_manager = InstrumentManager()
+        self.instrModel = InstrumentTableModel(self)
         self.nameList = []
         self.visaIdList = []
-        self.timer = None
+        self.timer = QTimer(self)  # auto refresh, started by doSetAutoRefresh
+        self.timer.timeout.connect(self.sendRefMsg)
         self.interval = 1000
         self.none_text = "*None*"  # Store the default none text
+        self.imgFileName = ''
+        self.screenshotPixMap = None
+        self._lastScreenshotDigest = None  # content hash of the displayed capture
+        self._captureInFlight = False  # a doRun or doSetRefresh capture is queued or running
+        self._scaled_cache = (None, None)  # (cache key, scaled pixmap)
+
+        # Instrument I/O runs on a single background thread, so the GUI stays
+        # responsive while VISA sessions are still used one request at a time
+        self.scpiPool = QThreadPool(self)
+        self.scpiPool.setMaxThreadCount(1)
+
+        # Error box reused for every failure instead of building a new one
+        self.errorBox = QMessageBox(self)
+        self.errorBox.setIcon(QMessageBox.Critical)
+        self.errorBox.setWindowTitle("Error")
+        self._lastError = (None, 0.0)  # (text, informative text) and close time of the last error
+
+        # Coalesce bursts of resize events into a single rescale
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self.updateScreenshot)
         
         # Load UI
         loader = QUiLoader()
         ui_file_path = get_file_inside_exe("resources/ui/mainwindow.ui")
-        print(f"Loading UI from {ui_file_path}")
+        logging.info("Loading UI from %s", ui_file_path)
         ui_file = QFile(ui_file_path)
         ui_file.open(QFile.ReadOnly)
         self.ui = loader.load(ui_file)
@@ -639,7 +1126,6 @@ class PythonScreenShot(QWidget):
         # Configure screenshot label
         self.ui.screenshotLabel.setMinimumSize(200, 200)
         self.ui.screenshotLabel.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.ui.screenshotLabel.setAlignment(Qt.AlignCenter)
         
         # Make sure the screenshot frame expands
         if hasattr(self.ui, 'screenshotFrame'):
@@ -658,12 +1144,18 @@ class PythonScreenShot(QWidget):
     def resizeEvent(self, event):
         """Handle main window resize events"""
         super().resizeEvent(event)
-        self.updateScreenshot()
+        self._resize_timer.start()
+
+    def screenshotTargetSize(self):
+        """Get the size screenshots are decoded at for display"""
+        # twice the label leaves room for enlarging the window; doSave reads
+        # the full resolution file instead
+        return self.ui.screenshotLabel.size() * 2
 
     def updateScreenshot(self):
-        """Update the screenshot display with high-quality scaling"""
+        """Update the screenshot display, reusing the last scaled pixmap if possible"""
         try:
-            if not hasattr(self, 'screenshotPixMap') or self.screenshotPixMap is None:
+            if self.screenshotPixMap is None:
                 return
 
             # Get the available space in the label
@@ -671,40 +1163,23 @@ class PythonScreenShot(QWidget):
             if available_size.width() <= 0 or available_size.height() <= 0:
                 return
 
-            # Calculate the scaled size maintaining aspect ratio
-            pixmap_size = self.screenshotPixMap.size()
-            scaled_size = pixmap_size.scaled(
-                available_size.width(),
-                available_size.height(),
-                Qt.KeepAspectRatio
-            )
+            # Nothing to do if this pixmap was already scaled to this size
+            cache_key = (self.screenshotPixMap.cacheKey(), available_size.width(), available_size.height())
+            if self._scaled_cache[0] == cache_key:
+                return
 
-            # Scale the original pixmap with high-quality transformation
+            # Scale once per settled size (resizes are debounced), so the
+            # smooth filter is affordable; the label centers the result
             scaled_pixmap = self.screenshotPixMap.scaled(
-                scaled_size.width(),
-                scaled_size.height(),
+                available_size,
                 Qt.KeepAspectRatio,
                 Qt.SmoothTransformation
             )
-
-            # Create a new pixmap with the background color
-            result_pixmap = QPixmap(available_size)
-            result_pixmap.fill(Qt.white)
-
-            # Calculate position to center the image
-            x = (available_size.width() - scaled_size.width()) // 2
-            y = (available_size.height() - scaled_size.height()) // 2
-
-            # Draw the scaled image onto the background
-            painter = QPainter(result_pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            painter.drawPixmap(x, y, scaled_pixmap)
-            painter.end()
+            self._scaled_cache = (cache_key, scaled_pixmap)
 
             # Set the final pixmap
-            self.ui.screenshotLabel.setPixmap(result_pixmap)
-            logging.debug(f"Updated screenshot to size: {scaled_size.width()}x{scaled_size.height()}")
+            self.ui.screenshotLabel.setPixmap(scaled_pixmap)
+            logging.debug(f"Updated screenshot to size: {scaled_pixmap.width()}x{scaled_pixmap.height()}")
 
         except Exception as e:
             logging.error(f"Error updating screenshot: {str(e)}", exc_info=True)
@@ -717,7 +1192,8 @@ class PythonScreenShot(QWidget):
         
         # Connect signals
         self.ui.doFindButton.clicked.connect(self.doFind)
-        self.ui.doRefreshButton.clicked.connect(self.doSetRefresh)
+        # a Get Screen click is always saved, only the timer skips unchanged screens
+        self.ui.doRefreshButton.clicked.connect(lambda: self.doSetRefresh())
         self.ui.doAutoRefreshButton.clicked.connect(self.doSetAutoRefresh)
         self.ui.doSaveButton.clicked.connect(self.doSave)
         self.ui.doSendClearButton.clicked.connect(self.doSendClear)
@@ -726,31 +1202,39 @@ class PythonScreenShot(QWidget):
         self.ui.doRunButton.clicked.connect(self.doRun)
         self.ui.doSendCommandButton.clicked.connect(self.doSendCommand)
         
+        # Only accept whole milliseconds in the auto refresh period; a new
+        # period is applied to the running timer as soon as it is entered
+        self.ui.autoRefPeriodEntry.setValidator(QIntValidator(AUTO_REFRESH_MIN_MS, AUTO_REFRESH_MAX_MS, self))
+        self.ui.autoRefPeriodEntry.editingFinished.connect(self.doSetAutoRefresh)
+        
         # Initialize the UI state
-        self.ui.instrTable.setColumnCount(4)
-        self.ui.instrTable.setHorizontalHeaderLabels(['Name','Description','Manufacturer','VISA ID'])
-        self.ui.instrTable.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.ui.instrTable.setSelectionMode(QTableWidget.SingleSelection)
-        self.ui.instrTable.setSelectionBehavior(QTableWidget.SelectRows)
+        self.ui.instrTable.setModel(self.instrModel)
+        self.ui.instrTable.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.ui.instrTable.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.ui.instrTable.setSelectionBehavior(QAbstractItemView.SelectRows)
         
         # Load the SCPI dino image
         dino_path = get_file_inside_exe('resources/images/SCPILogoDinosaur.png')
-        self.scpiDinoPixMap = QPixmap(dino_path)
-        if not self.scpiDinoPixMap.isNull():
+        dinoPixMap = self.scpiDinoPixMap()
+        if not dinoPixMap.isNull():
             label_size = self.ui.scpiDinoLabel.size()
-            scaled_pixmap = self.scpiDinoPixMap.scaled(label_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            scaled_pixmap = dinoPixMap.scaled(label_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
             self.ui.scpiDinoLabel.setPixmap(scaled_pixmap)
             logging.info(f"Loaded SCPI dino image from {dino_path}")
         else:
             logging.error(f"Failed to load SCPI dino image from {dino_path}")
         
-        # Initialize screenshot label with white background
-        pixMap = QPixmap(1024, 800)
-        pixMap.fill(Qt.white)
-        self.ui.screenshotLabel.setPixmap(pixMap)
+        # Initialize screenshot label with white background; the placeholder
+        # also gives the label its initial size hint
+        self.ui.screenshotLabel.setPixmap(self.blankPixMap())
         
-        # Set up resizing behavior
-        self.ui.screenshotLabel.setScaledContents(True)
+        # Set up resizing behavior; updateScreenshot scales with the aspect
+        # ratio kept and the label centers it on a white background, so no
+        # QPainter composite is needed. scaledContents would stretch the
+        # pixmap to the label and distort it, so it stays off.
+        self.ui.screenshotLabel.setScaledContents(False)
+        self.ui.screenshotLabel.setAlignment(Qt.AlignCenter)
+        self.ui.screenshotLabel.setStyleSheet("background-color: white;")
         
     def setup_language_selector(self):
         """Set up the language selection combo box."""
@@ -764,15 +1248,17 @@ class PythonScreenShot(QWidget):
         # Add languages to combo box
         self.ui.languageComboBox.addItems(self.languages.keys())
         
-        # Set current language based on system locale
-        current_locale = QLocale.system().name()
-        for name, locale in self.languages.items():
-            if locale.startswith(current_locale[:2]):
-                self.ui.languageComboBox.setCurrentText(name)
-                break
-        else:
-            # Default to English if system locale is not supported
-            self.ui.languageComboBox.setCurrentText("English")
+        # Set current language to the first supported one in the user's
+        # ordered preference list, default to English if none is supported
+        language_by_prefix = {locale[:2]: name for name, locale in self.languages.items()}
+        name = next((language_by_prefix[ui_language[:2]]
+                     for ui_language in QLocale.system().uiLanguages()
+                     if ui_language[:2] in language_by_prefix), "English")
+        self.ui.languageComboBox.setCurrentText(name)
+        # the preferred UI language can differ from the formatting locale
+        # the startup translator was loaded for
+        if self.languages[name] != QLocale.system().name():
+            load_translations(QApplication.instance(), self.languages[name])
         
         # Connect change event
         self.ui.languageComboBox.currentTextChanged.connect(self.change_language)
@@ -798,322 +1284,379 @@ class PythonScreenShot(QWidget):
         self.setWindowTitle(self.version_manager.window_title)
         self.ui.headerTopZ.setText(self.version_manager.version_string)
         
-        # Update header labels
-        self.ui.headerTopS.setText(QApplication.translate("PythonScreenShot", "PYTHON SCPI SCREENSHOT"))
-        
-        # Update buttons
-        self.ui.doFindButton.setText(QApplication.translate("PythonScreenShot", "Find Instruments"))
-        self.ui.doRefreshButton.setText(QApplication.translate("PythonScreenShot", "Get Screen"))
-        self.ui.doAutoRefreshButton.setText(QApplication.translate("PythonScreenShot", "Auto Refresh"))
-        self.ui.doSaveButton.setText(QApplication.translate("PythonScreenShot", "Save to ..."))
-        self.ui.doSendClearButton.setText(QApplication.translate("PythonScreenShot", "Clear Error"))
-        self.ui.doSendResetButton.setText(QApplication.translate("PythonScreenShot", "Send Reset"))
-        self.ui.doGetLastErrorButton.setText(QApplication.translate("PythonScreenShot", "Get Last Error"))
-        self.ui.doRunButton.setText(QApplication.translate("PythonScreenShot", "Send Run"))
-        self.ui.doSendCommandButton.setText(QApplication.translate("PythonScreenShot", "Send Command"))
-        
-        # Update labels
-        self.ui.labelStatic.setText(QApplication.translate("PythonScreenShot", "Available VISA Instruments"))
-        self.ui.labelAutoRefPeriod.setText(QApplication.translate("PythonScreenShot", "Auto Refresh Period (ms)"))
-        self.ui.labelScpiCommand.setText(QApplication.translate("PythonScreenShot", "SCPI Command Text"))
-        self.ui.labelScpiReplyStatic.setText(QApplication.translate("PythonScreenShot", "Last SCPI Reply"))
+        # Update header label, buttons, labels and checkbox; setText() is
+        # skipped when the translation did not change the text
+        tr = QApplication.translate
+        for widgetName, sourceText in self.TRANSLATED_TEXTS:
+            widget = getattr(self.ui, widgetName)
+            text = tr("PythonScreenShot", sourceText)
+            if widget.text() != text:
+                widget.setText(text)
         
-        # Update checkbox
-        self.ui.binaryData.setText(QApplication.translate("PythonScreenShot", "Bin"))
-        
-        # Update table headers
-        headers = ["Name", "Description", "Manufacturer", "VISA ID"]
-        for i, header in enumerate(headers):
-            item = self.ui.instrTable.horizontalHeaderItem(i)
-            if item:  # Make sure the header item exists
-                item.setText(QApplication.translate("PythonScreenShot", header))
+        # Update table headers, the model translates them on request
+        self.instrModel.headerDataChanged.emit(Qt.Horizontal, 0, self.instrModel.columnCount() - 1)
         
         # Update tooltips
-        self.ui.languageComboBox.setToolTip(QApplication.translate("PythonScreenShot", "Select Language"))
+        self.ui.languageComboBox.setToolTip(tr("PythonScreenShot", "Select Language"))
         
         # Update SCPI reply label - only translate if it's the default none text
         current_text = self.ui.labelScpiReply.text()
-        translated_none = QApplication.translate("PythonScreenShot", self.none_text)
         if current_text.startswith("*") and current_text.endswith("*"):
-            self.ui.labelScpiReply.setText(translated_none)
+            self.ui.labelScpiReply.setText(tr("PythonScreenShot", self.none_text))
     
     def doFind(self):
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        self.ui.doAutoRefreshButton.setChecked(False)
+        self._stopAutoRefresh()
+        optional_ip_address = self.ui.manualIP.text()
+        network_timeout = int(self.ui.networkTimeout.value())
+        # the scan takes up to the network timeout, run it on the SCPI pool
+        # so the window keeps painting; Find stays disabled until it is done
+        self.ui.doFindButton.setEnabled(False)
+        worker = Worker(GetVisaSCPIResources, optional_ip_address, network_timeout)
+        worker.signals.finished.connect(self.onFindFinished)
+        worker.signals.error.connect(self.onFindError)
+        worker.start(self.scpiPool)
+        return
+
+    def onFindFinished(self, result):
+        """Fill the instrument table with the resources found by doFind"""
+        self.ui.doFindButton.setEnabled(True)
         try:
-            self.ui.instrTable.clear()
-            self.ui.instrTable.setHorizontalHeaderLabels(['Name','Description','Manufacturer','VISA ID'])
-            optional_ip_address = self.ui.manualIP.text()
-            network_timeout = int(self.ui.networkTimeout.value())
-            self.visaIdList, self.nameList = GetVisaSCPIResources(optional_ip_address, network_timeout)
-            self.ui.instrTable.setRowCount(len(self.nameList))
-            for i in range(len(self.nameList)):
-                nameListComps = self.nameList[i].split(',')
-                mfgName       = nameListComps[0].strip()
-                instrName     = nameListComps[1].strip()
-                serialNo      = nameListComps[2].strip()
-                versionText   = nameListComps[3].strip()
-                instrType     = InstrumentManager().get_instrument_type(instrName)
-                self.ui.instrTable.setItem(i,0,QTableWidgetItem(instrName))
-                self.ui.instrTable.setItem(i,1,QTableWidgetItem(instrType))
-                self.ui.instrTable.setItem(i,2,QTableWidgetItem(mfgName))
-                self.ui.instrTable.setItem(i,3,QTableWidgetItem(self.visaIdList[i]))
-            QApplication.restoreOverrideCursor()
-        except:
-            msg = QMessageBox()
-            msg.setIcon(QMessageBox.Critical)
-            msg.setText("No Instruments  found.")
-            msg.setInformativeText('See Log for More information')
-            msg.setWindowTitle("Error")
-            msg.exec()
-        QApplication.restoreOverrideCursor()
-        return    
+            self.visaIdList, self.nameList = result
+            with wait_cursor():
+                self._populateInstrTable()
+        except Exception as e:
+            logging.error(f"Filling the instrument table failed: {str(e)}", exc_info=True)
+            self.showError("No Instruments  found.", 'See Log for More information')
+
+    def onFindError(self, error_text):
+        self.ui.doFindButton.setEnabled(True)
+        self.showError("No Instruments  found.", 'See Log for More information')
+
+    def _populateInstrTable(self):
+        """Show self.nameList / self.visaIdList in the instrument table"""
+        names, types, mfgs = [], [], []
+        for idnReply in self.nameList:
+            nameListComps = idnReply.split(',')
+            mfgName       = nameListComps[0].strip()
+            instrName     = nameListComps[1].strip()
+            serialNo      = nameListComps[2].strip()
+            versionText   = nameListComps[3].strip()
+            names.append(instrName)
+            types.append(self.instrument_manager.get_instrument_type(instrName))
+            mfgs.append(mfgName)
+        # one model reset replaces all rows, the view only paints visible cells
+        self.instrModel.setInstruments(names, types, mfgs, list(self.visaIdList))
    
-    def doSetRefresh(self):
-        itemList = self.ui.instrTable.selectedItems()
-        if len(itemList) == 0:
-            self.ui.doAutoRefreshButton.setChecked(False)
+    def showError(self, text, informativeText):
+        """Show the shared critical error box, dropping a repeat of the last error within a second"""
+        if self.errorBox.isVisible():
+            # exec() runs a nested event loop; a worker failing meanwhile
+            # must not start a second exec() on the open box
             return
-        instrName = itemList[0].text().strip()
-        instrType = itemList[1].text().strip()
-        visaId    = itemList[3].text().strip()
-        if instrType == '':
-            # complain
+        now = time.monotonic()
+        lastError, lastTime = self._lastError
+        if lastError == (text, informativeText) and now - lastTime < ERROR_REPEAT_S:
             return
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        try:
-            self.imgFileName = GetScreenShot(instrType,visaId)
-            self.screenshotPixMap = QPixmap(self.imgFileName)
-            self.updateScreenshot()
-            QApplication.restoreOverrideCursor()
-        except:
-            self.ui.doAutoRefreshButton.setChecked(False)
-            QApplication.restoreOverrideCursor()
-            msg = QMessageBox()
-            msg.setIcon(QMessageBox.Critical)
-            msg.setText("SCPI Error")
-            msg.setInformativeText('See Log for More information')
-            msg.setWindowTitle("Error")
-            msg.exec()
+        self.errorBox.setText(text)
+        self.errorBox.setInformativeText(informativeText)
+        self.errorBox.exec()
+        # measured when the box is closed, so a queued failure of the same
+        # kind right after dismissing it does not pop it up again
+        self._lastError = ((text, informativeText), time.monotonic())
+
+    def _stopAutoRefresh(self):
+        """Uncheck auto refresh and stop its timer right away"""
+        # setChecked() does not emit clicked, so doSetAutoRefresh won't run
+        self.ui.doAutoRefreshButton.setChecked(False)
+        self.timer.stop()
+
+    def _selectedInstrument(self, requireType=False):
+        """Get (name, type, VISA ID) of the selected row, or None if nothing is selected
+
+        With requireType, an instrument of unknown type also gives None.
+        """
+        rowList = self.ui.instrTable.selectionModel().selectedRows()
+        if len(rowList) == 0:
+            self._stopAutoRefresh()
+            return None
+        selected = self.instrModel.instrument(rowList[0].row())
+        instrName, instrType, visaId = selected
+        if requireType and instrType == '':
+            return None
+        return selected
+
+    def doSetRefresh(self, skipUnchanged=False):
+        """Capture a screenshot, with skipUnchanged an identical screen is not saved again"""
+        selected = self._selectedInstrument(requireType=True)
+        if selected is None:
+            return
+        instrName, instrType, visaId = selected
+        if self._captureInFlight:
+            # the previous capture is still running, skip this tick
+            return
+        self._captureInFlight = True
+        # the capture runs on the SCPI pool, the GUI stays responsive
+        lastDigest = self._lastScreenshotDigest if skipUnchanged else None
+        worker = Worker(CaptureScreenShotImage, instrType, visaId,
+                        self.screenshotTargetSize(), lastDigest)
+        worker.signals.finished.connect(self.onRefreshFinished)
+        worker.signals.error.connect(self.onRefreshError)
+        worker.start(self.scpiPool)
         return
 
+    def onRefreshFinished(self, result):
+        """Show the screenshot captured by doSetRefresh"""
+        self._finishRefresh()
+        try:
+            self.showCapturedScreenshot(result)
+        except Exception as e:
+            logging.error(f"Screenshot refresh failed: {str(e)}", exc_info=True)
+            self.onRunError(str(e))
+
+    def onRefreshError(self, error_text):
+        self._finishRefresh()
+        self.onRunError(error_text)
+
+    def _finishRefresh(self):
+        """Mark the refresh as done and restart the auto refresh period"""
+        self._captureInFlight = False
+        # a slow instrument still gets the configured idle time between captures
+        if self.timer.isActive():
+            self.timer.start(self.interval)
+
     def doSendClear(self):
-        itemList = self.ui.instrTable.selectedItems()
-        if len(itemList) == 0:
-            self.ui.doAutoRefreshButton.setChecked(False)
+        selected = self._selectedInstrument(requireType=True)
+        if selected is None:
             return
-        instrName = itemList[0].text().strip()
-        instrType = itemList[1].text().strip()
-        visaId    = itemList[3].text().strip()
-        if instrType == '':
-            # complain
-            return
-        self.ui.doAutoRefreshButton.setChecked(False)
-        InstrumentCommunicator.send_command(visaId,'*CLS')
-        self.ui.labelScpiReply.setText('')
+        instrName, instrType, visaId = selected
+        self._stopAutoRefresh()
+        worker = Worker(InstrumentCommunicator.send_command, visaId, '*CLS')
+        worker.signals.finished.connect(lambda result: self.ui.labelScpiReply.setText(''))
+        worker.start(self.scpiPool)
         return
 
     def doSendReset(self):
-        itemList = self.ui.instrTable.selectedItems()
-        if len(itemList) == 0:
-            self.ui.doAutoRefreshButton.setChecked(False)
-            return
-        instrName = itemList[0].text().strip()
-        instrType = itemList[1].text().strip()
-        visaId    = itemList[3].text().strip()
-        if instrType == '':
-            # complain
+        selected = self._selectedInstrument(requireType=True)
+        if selected is None:
             return
-        self.ui.doAutoRefreshButton.setChecked(False)
-        InstrumentCommunicator.send_command(visaId,'*RST')
-        self.ui.labelScpiReply.setText('')
+        instrName, instrType, visaId = selected
+        self._stopAutoRefresh()
+        worker = Worker(InstrumentCommunicator.send_command, visaId, '*RST')
+        worker.signals.finished.connect(lambda result: self.ui.labelScpiReply.setText(''))
+        worker.start(self.scpiPool)
         return
 
     def doRun(self):
         """Execute screenshot capture"""
+        selected = self._selectedInstrument()
+        if selected is None:
+            logging.warning("No instrument selected")
+            return
+        
+        # drop the click instead of queueing a second capture behind a
+        # running one, the pool would only deliver a stale picture later
+        if self._captureInFlight:
+            logging.info("Screenshot capture already running, request dropped")
+            return
+        
+        instrName, _, visaId = selected
+        logging.info(f"Running screenshot for instrument: {instrName} ({visaId})")
+        
+        instrType = self.instrument_manager.get_instrument_type(instrName)
+        
+        if not instrType:
+            # nothing was started, the flag and cursor belong to a running capture
+            logging.error(f"No instrument type found for: {instrName}")
+            self.showError("SCPI Error", f'Error: Unknown instrument type for: {instrName}\nSee screenshot.log for more information')
+            return
+        
+        self._captureInFlight = True
+        QApplication.setOverrideCursor(Qt.WaitCursor)
         try:
-            itemList = self.ui.instrTable.selectedItems()
-            if len(itemList) == 0:
-                logging.warning("No instrument selected")
-                self.ui.doAutoRefreshButton.setChecked(False)
-                return
-            
-            instrName = itemList[0].text().strip()
-            visaId = itemList[3].text().strip()  # VISA ID is in column 3
-            logging.info(f"Running screenshot for instrument: {instrName} ({visaId})")
-            
-            instrument_manager = InstrumentManager()
-            instrType = instrument_manager.get_instrument_type(instrName)
-            
-            if not instrType:
-                logging.error(f"No instrument type found for: {instrName}")
-                raise Exception(f"Unknown instrument type for: {instrName}")
-            
-            QApplication.setOverrideCursor(Qt.WaitCursor)
             logging.info(f"Getting screenshot for type: {instrType}")
             
-            self.imgFileName = GetScreenShot(instrType, visaId)
-            if not self.imgFileName:
-                raise Exception("Failed to get screenshot")
-                
-            logging.info(f"Loading screenshot from: {self.imgFileName}")
-            self.screenshotPixMap = QPixmap(self.imgFileName)
-            if self.screenshotPixMap.isNull():
-                raise Exception("Failed to load screenshot image")
-                
-            self.updateScreenshot()
-            QApplication.restoreOverrideCursor()
+            # Capture and decode run in the background, only the pixmap is
+            # created on the GUI thread once they have finished. No digest
+            # is passed, a Run is always saved, even on an unchanged screen
+            worker = Worker(CaptureScreenShotImage, instrType, visaId,
+                            self.screenshotTargetSize())
+            worker.signals.finished.connect(self.onRunFinished)
+            worker.signals.error.connect(self.onRunError)
+            worker.start(self.scpiPool)
             
         except Exception as e:
             logging.error(f"Screenshot capture failed: {str(e)}", exc_info=True)
-            self.ui.doAutoRefreshButton.setChecked(False)
-            QApplication.restoreOverrideCursor()
-            msg = QMessageBox()
-            msg.setIcon(QMessageBox.Critical)
-            msg.setText("SCPI Error")
-            msg.setInformativeText(f'Error: {str(e)}\nSee screenshot.log for more information')
-            msg.setWindowTitle("Error")
-            msg.exec()
+            self.onRunError(str(e))
         return
 
-    def doSendGetLastError(self):
-        itemList = self.ui.instrTable.selectedItems()
-        if len(itemList) == 0:
-            self.ui.doAutoRefreshButton.setChecked(False)
+    def showCapturedScreenshot(self, result):
+        """Display a (file name, digest, QImage) result of CaptureScreenShotImage"""
+        fileName, digest, image = result
+        # An idle instrument returns the same picture on auto refresh, keep the current one
+        if fileName is None:
             return
-        instrName = itemList[0].text().strip()
-        instrType = itemList[1].text().strip()
-        visaId    = itemList[3].text().strip()
-        if instrType == '':
-            # complain
+        if not fileName:
+            raise Exception("Failed to get screenshot")
+        if image.isNull():
+            raise Exception("Failed to load screenshot image")
+
+        self.imgFileName = fileName
+        self.screenshotPixMap = QPixmap.fromImage(image)
+        self.updateScreenshot()
+        self._lastScreenshotDigest = digest
+
+    def onRunFinished(self, result):
+        """Show the screenshot captured by doRun"""
+        self._captureInFlight = False
+        try:
+            self.showCapturedScreenshot(result)
+            QApplication.restoreOverrideCursor()
+            
+        except Exception as e:
+            logging.error(f"Screenshot capture failed: {str(e)}", exc_info=True)
+            self.onRunError(str(e))
+
+    def onRunError(self, error_text):
+        self._captureInFlight = False
+        self._stopAutoRefresh()
+        QApplication.restoreOverrideCursor()
+        self.showError("SCPI Error", f'Error: {error_text}\nSee screenshot.log for more information')
+
+    def doSendGetLastError(self):
+        selected = self._selectedInstrument(requireType=True)
+        if selected is None:
             return
-        self.ui.doAutoRefreshButton.setChecked(False)
-        result = InstrumentCommunicator.send_query(visaId,':SYST:ERR?')
-        self.ui.labelScpiReply.setText(result)
+        instrName, instrType, visaId = selected
+        self._stopAutoRefresh()
+        worker = Worker(InstrumentCommunicator.send_query, visaId, ':SYST:ERR?')
+        worker.signals.finished.connect(self.ui.labelScpiReply.setText)
+        worker.start(self.scpiPool)
         return
 
     def doSendCommand(self):
         #print("sending command")
-        itemList = self.ui.instrTable.selectedItems()
-        if len(itemList) == 0:
-            self.ui.doAutoRefreshButton.setChecked(False)
-            return
-        instrName = itemList[0].text().strip()
-        instrType = itemList[1].text().strip()
-        visaId    = itemList[3].text().strip()
-        if instrType == '':
-            # complain
+        selected = self._selectedInstrument(requireType=True)
+        if selected is None:
             return
-        self.ui.doAutoRefreshButton.setChecked(False)
+        instrName, instrType, visaId = selected
+        self._stopAutoRefresh()
         cmdText = self.ui.scpiCommandEntry.text().strip()
         #print(cmdText)
         if (len(cmdText) > 0):
-            cmdTextParts = cmdText.split(' ')
-            if "?" in cmdTextParts[0]:
-                result = InstrumentCommunicator.send_query(visaId,cmdText)
-                #print(result)
-                
-                # For binary data, show a message instead of the raw data
-                if isinstance(result, bytes):
-                    display_text = "[Binary data received]"
-                else:
-                    display_text = result
-                    
-                self.ui.labelScpiReply.setText(display_text)
-                
-                # Save query data if binaryData checkbox is checked
-                if self.ui.binaryData.isChecked():
-                    import os
-                    import datetime
-                    
-                    # Create data directory using get_file_near_exe
-                    data_dir = get_file_near_exe('query_data')
-                    os.makedirs(data_dir, exist_ok=True)
-                    
-                    # Generate filename with timestamp and appropriate extension
-                    timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-                    cmd_upper = cmdText.upper()
-                    # Determine file extension based on command
-                    if 'BMP' in cmd_upper:
-                        extension = '.bmp'
-                    elif any(x in cmd_upper for x in ['HCOP', 'DUMP', 'DATA?', 'DISP:DATA?']):
-                        extension = '.png'  # Most modern scopes use PNG format
-                    else:
-                        extension = '.dat'
-                    filename = f'query_{timestamp}{extension}'
-                    filepath = os.path.join(data_dir, filename)
-                    
-                    # Save the raw response data
-                    try:
-                        if isinstance(result, (bytes, bytearray)):
-                            data = result
-                        else:
-                            # If result is string or other type, encode it
-                            data = str(result).encode('utf-8')
-                            
-                        with open(filepath, 'wb') as f:
-                            f.write(data)
-                            
-                        # Update status to show where file was saved
-                        self.ui.labelScpiReply.setText(f'Data saved to: {filepath}')
-                    except Exception as e:
-                        self.ui.labelScpiReply.setText(f'Error saving data: {str(e)}\n\nResponse: {result}')
+            cmdHeader, _, _ = cmdText.partition(' ')
+            if "?" in cmdHeader:
+                worker = Worker(InstrumentCommunicator.send_query, visaId, cmdText)
+                worker.signals.finished.connect(lambda result: self.onQueryReply(cmdText, result))
+            else:
+                worker = Worker(InstrumentCommunicator.send_command, visaId, cmdText)
+            worker.start(self.scpiPool)
+        return
+
+    def onQueryReply(self, cmdText, result):
+        """Show (and optionally save) the reply of a query sent by doSendCommand"""
+        # For binary data, show a message instead of the raw data
+        if isinstance(result, (bytes, bytearray, memoryview)):
+            display_text = "[Binary data received]"
+        else:
+            display_text = result
+            
+        self.ui.labelScpiReply.setText(display_text)
+        
+        # Save query data if binaryData checkbox is checked
+        if self.ui.binaryData.isChecked():
+            # Create data directory using get_file_near_exe
+            data_dir = get_file_near_exe('query_data')
+            os.makedirs(data_dir, exist_ok=True)
+            
+            # Generate filename with timestamp and appropriate extension
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            # Determine file extension based on command, BMP anywhere wins
+            extensions = {QUERY_DATA_EXTENSIONS.get(keyword.upper())
+                          for keyword in BINARY_QUERY_RE.findall(cmdText)}
+            extension = next((ext for ext in ('.bmp', '.png') if ext in extensions), '.dat')
+            filename = f'query_{timestamp}{extension}'
+            filepath = os.path.join(data_dir, filename)
+            
+            # Save the raw response data
+            if isinstance(result, (bytes, bytearray, memoryview)):
+                data = result
             else:
-                result = InstrumentCommunicator.send_command(visaId,cmdText)
-                #print(result)
+                # If result is string or other type, encode it
+                data = str(result).encode('utf-8')
+                
+            # Large binary dumps are written in the background, the status
+            # label shows where the file was saved once it is on disk
+            worker = Worker(FileManager.write_binary_file, data, filepath)
+            worker.signals.finished.connect(
+                lambda _: self.ui.labelScpiReply.setText(f'Data saved to: {filepath}'))
+            worker.signals.error.connect(
+                lambda error_text: self.ui.labelScpiReply.setText(f'Error saving data: {error_text}\n\nResponse: {display_text}'))
+            worker.start()
         return
 
     def doSetAutoRefresh(self):
-        self.interval = min(10000.,max(200.,int(self.ui.autoRefPeriodEntry.text())))
+        try:
+            interval = int(self.ui.autoRefPeriodEntry.text())
+        except ValueError:
+            interval = self.interval
+        self.interval = min(AUTO_REFRESH_MAX_MS, max(AUTO_REFRESH_MIN_MS, interval))
+        
+        # Show the period that is actually used
+        if self.ui.autoRefPeriodEntry.text() != str(self.interval):
+            self.ui.autoRefPeriodEntry.setText(str(self.interval))
+        
         if self.ui.doAutoRefreshButton.isChecked():
-            self.timer = QTimer()
-            # self.timer.setSingleShot(True)
-            self.timer.setInterval(int(self.interval))
-            self.timer.timeout.connect(self.sendRefMsg)
-            self.timer.start()            
+            self.timer.setInterval(self.interval)
+            self.timer.start()
         else:
             self.timer.stop()
         return
 
     def sendRefMsg(self):
-        self.doSetRefresh()
+        # the period restarts once the capture has finished, see _finishRefresh
+        self.doSetRefresh(skipUnchanged=True)
         return
 
     def doSave(self):
+        if not self.imgFileName:
+            # nothing captured yet, there is nothing to save
+            return
+        # Preselect the format of the capture, so the common case is a copy.
+        # The payload is sniffed, a configured file_type can be wrong
+        reader = QImageReader(self.imgFileName)
+        reader.setDecideFormatFromContent(True)
+        capturedFormat = bytes(reader.format()).decode('ascii').upper()
+        capturedFilter = next((saveFilter for saveFilter, (_, image_format, _) in SAVE_FILTERS.items()
+                               if image_format == capturedFormat), DEFAULT_SAVE_FILTER)
         options = QFileDialog.Options()
         newFileName, selectedFilter = QFileDialog.getSaveFileName(
             self,
             "Save Screenshot as ...",
             "",
-            "PNG Files (*.png);;JPEG Files (*.jpg);;BMP Files (*.bmp)",
+            ";;".join(SAVE_FILTERS),
+            capturedFilter,
             options=options
         )
-        if newFileName and self.imgFileName:
-            # Load the image using QPixmap
-            pixmap = QPixmap(self.imgFileName)
-            
+        if newFileName:
             # Ensure the file has the correct extension based on the selected filter
-            if selectedFilter == "PNG Files (*.png)" and not newFileName.lower().endswith('.png'):
-                newFileName += '.png'
-            elif selectedFilter == "JPEG Files (*.jpg)" and not newFileName.lower().endswith(('.jpg', '.jpeg')):
-                newFileName += '.jpg'
-            elif selectedFilter == "BMP Files (*.bmp)" and not newFileName.lower().endswith('.bmp'):
-                newFileName += '.bmp'
+            extensions, image_format, quality = SAVE_FILTERS.get(selectedFilter, SAVE_FILTERS[DEFAULT_SAVE_FILTER])
+            if not newFileName.lower().endswith(extensions):
+                newFileName += extensions[0]
             
-            # Convert to the desired format
-            if newFileName.lower().endswith(('.jpg', '.jpeg')):
-                # For JPEG, we need to handle transparency by creating a white background
-                image = QImage(pixmap.size(), QImage.Format_RGB32)
-                image.fill(Qt.white)
-                painter = QPainter(image)
-                painter.drawPixmap(0, 0, pixmap)
-                painter.end()
-                image.save(newFileName, "JPEG", 95)  # 95 is the quality
+            if image_format == capturedFormat:
+                # Same format, the captured file can be copied as is
+                worker = Worker(shutil.copyfile, self.imgFileName, newFileName)
             else:
-                # For PNG and BMP, we can save directly
-                pixmap.save(newFileName, quality=100)
+                # Decode the full resolution capture (the displayed pixmap
+                # may be downscaled) and encode it, both in the background
+                worker = Worker(FileManager.convert_image, self.imgFileName, newFileName, image_format, quality)
+            worker.signals.error.connect(self.onSaveError)
+            worker.start()
         return
 
+    def onSaveError(self, error_text):
+        self.showError("Save Error", f'Error: {error_text}\nSee screenshot.log for more information')
+
 
 
 # *************************************************************************** #
@@ -1125,4 +1668,5 @@ if __name__ == '__main__':
     load_translations(app)
     app.setStyle('Windows')
     inst    = PythonScreenShot()
+    app.aboutToQuit.connect(close_all_resources)
     sys.exit(app.exec())
@@ -9,9 +9,15 @@ import yaml
 import glob
 import logging
 import subprocess
+import threading
 from datetime import datetime
 import shutil
 
+# Upper limit for a single Nuitka run in seconds
+BUILD_TIMEOUT = 3600
+# Modules generated for the build only, kept out of the source checkout
+GENERATED_DIR = os.path.join("build", "generated")
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,12 +32,12 @@ def load_version_info():
     """Load version information from version.yaml"""
     try:
         with open('config/version.yaml', 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
     except Exception as e:
         logging.error(f"Failed to load version info: {e}")
         raise
 
-def get_data_file_args():
+def get_data_file_args(embedded_translations=False):
     """Get data file arguments for Nuitka"""
     args = []
     
@@ -40,20 +46,62 @@ def get_data_file_args():
         args.append("--include-data-dir=config=config")
         args.append("--include-data-dir=resources=resources")
         
+        # Whole directories are copied in one pass; leave out what is only
+        # needed to edit or generate the resources, and local parse caches
+        args.extend(f"--noinclude-data-files={pattern}" for pattern in (
+            "config/*.json",                  # YAML parse caches
+            "resources/translations/*.ts",    # translation sources
+            "resources/translations/*.qrc",   # compiled into translations_rc
+            "resources/images/*.kra",         # Krita source of the logo
+        ))
+        if embedded_translations:
+            # already inside translations_rc
+            args.append("--noinclude-data-files=resources/translations/*.qm")
+        
         logging.info(f"Data files to be included: {args}")
         return args
     except Exception as e:
         logging.error(f"Error preparing data file arguments: {e}")
         raise
 
+def pump_output(stream):
+    """Forward the lines of a process output stream to the build log"""
+    for line in stream:
+        logging.info(line.rstrip())
+    stream.close()
+
+def compile_translation_resource():
+    """Compile the .qm files into translations_rc.py with pyside6-rcc, return whether it worked"""
+    rcc = shutil.which("pyside6-rcc")
+    if rcc is None:
+        logging.warning("pyside6-rcc not found, translations are loaded from the data files")
+        return False
+    os.makedirs(GENERATED_DIR, exist_ok=True)
+    cmd = [rcc, "resources/translations/translations.qrc", "-o", os.path.join(GENERATED_DIR, "translations_rc.py")]
+    logging.info("Compiling translation resource: %s", " ".join(cmd))
+    try:
+        subprocess.run(cmd, check=True)
+    except subprocess.CalledProcessError as e:
+        logging.warning(f"pyside6-rcc failed ({e.returncode}), translations are loaded from the data files")
+        return False
+    return True
+
 def build_application():
     """Build the application using Nuitka"""
     try:
         version_info = load_version_info()
         version = version_info['version']
         
+        # Embed the translations, Nuitka follows the translations_rc import
+        # once the generated directory is on its module search path
+        embedded_translations = compile_translation_resource()
+        env = dict(os.environ)
+        if embedded_translations:
+            env["PYTHONPATH"] = os.pathsep.join(
+                filter(None, [os.path.abspath(GENERATED_DIR), env.get("PYTHONPATH")]))
+        
         # Get data file arguments
-        data_file_args = get_data_file_args()
+        data_file_args = get_data_file_args(embedded_translations)
         
         # Build the command as a single list
         cmd_parts = [
@@ -116,19 +164,23 @@ def build_application():
         logging.info(f"Building Python Screenshot v{version}...")
         
         logging.info("Starting Nuitka process...")
-        # Run process with direct console output
+        # Run process, its output goes live to the console and into build.log
         try:
             process = subprocess.Popen(
                 cmd_parts,
-                stdout=None,
-                stderr=None,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
                 bufsize=1,  # Line buffered
-                universal_newlines=True
+                universal_newlines=True,
+                env=env
             )
+            pump = threading.Thread(target=pump_output, args=(process.stdout,), daemon=True)
+            pump.start()
             
             # Wait for the process to complete
-            return_code = process.wait()
+            return_code = process.wait(timeout=BUILD_TIMEOUT)
+            pump.join()
             
             if return_code == 0:
                 logging.info("Build completed successfully!")
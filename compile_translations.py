@@ -5,6 +5,7 @@ import os
 import sys
 import logging
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def find_lrelease():
@@ -12,8 +13,20 @@ def find_lrelease():
     base_dir = Path(__file__).resolve().parent
     venv_dir = base_dir / ".venv"
     
-    # Common paths for lrelease
-    possible_paths = [
+    # Common paths for lrelease, starting with the one shipped in the
+    # PySide6 package of the running interpreter
+    possible_paths = []
+    try:
+        import PySide6
+        pyside_dir = Path(PySide6.__file__).resolve().parent
+        possible_paths += [
+            pyside_dir / "lrelease.exe",
+            pyside_dir / "lrelease",
+            pyside_dir / "Qt" / "libexec" / "lrelease",
+        ]
+    except ImportError:
+        pass
+    possible_paths += [
         base_dir / ".venv" / "Lib" / "site-packages" / "PySide6" / "lrelease.exe",
         venv_dir / "Scripts" / "lrelease.exe",
         Path("lrelease"),  # If in PATH
@@ -34,6 +47,21 @@ def find_lrelease():
     
     return None
 
+def compile_ts_file(lrelease, ts_file):
+    """Compile one .ts file, return (success, error message)"""
+    qm_file = ts_file.with_suffix(".qm")
+    cmd = [lrelease, str(ts_file), "-qm", str(qm_file)]
+    try:
+        subprocess.run(cmd, check=True, capture_output=True, text=True)
+    except subprocess.CalledProcessError as e:
+        return False, (f"Running command: {' '.join(cmd)}\n"
+                       f"Exit code: {e.returncode}\n"
+                       f"stdout: {e.stdout}\n"
+                       f"stderr: {e.stderr}")
+    if not qm_file.exists():
+        return False, "Warning: Output file was not created"
+    return True, ""
+
 def compile_translations():
     """Compile all .ts files to .qm files"""
     base_dir = Path(__file__).resolve().parent
@@ -55,33 +83,19 @@ def compile_translations():
         print("You can download Qt tools from: https://www.qt.io/download")
         return False
     
+    # each lrelease run is a separate process, so the files compile in parallel
+    ts_files = sorted(translations_dir.glob("*.ts"))
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(lambda ts_file: compile_ts_file(lrelease, ts_file), ts_files))
+    
+    # report in file order once all are done, details only for failures
     success = True
-    for ts_file in translations_dir.glob("*.ts"):
-        qm_file = ts_file.with_suffix(".qm")
-        print(f"\nCompiling {ts_file.name} to {qm_file.name}")
-        print(f"Input file exists: {ts_file.exists()}")
-        print(f"Input file size: {ts_file.stat().st_size} bytes")
-        
-        cmd = [lrelease, str(ts_file), "-qm", str(qm_file)]
-        print(f"Running command: {' '.join(cmd)}")
-        
-        try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            print(f"Successfully compiled {ts_file.name} to {qm_file.name}")
-            print("Output:")
-            print(result.stdout)
-            
-            if qm_file.exists():
-                print(f"Output file size: {qm_file.stat().st_size} bytes")
-            else:
-                print("Warning: Output file was not created")
-                success = False
-                
-        except subprocess.CalledProcessError as e:
-            print(f"Error compiling {ts_file.name}:")
-            print(f"Exit code: {e.returncode}")
-            print(f"stdout: {e.stdout}")
-            print(f"stderr: {e.stderr}")
+    for ts_file, (ok, message) in zip(ts_files, results):
+        if ok:
+            print(f"Successfully compiled {ts_file.name} to {ts_file.with_suffix('.qm').name}")
+        else:
+            print(f"\nError compiling {ts_file.name}:")
+            print(message)
             success = False
     
     return success
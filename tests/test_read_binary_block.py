@@ -0,0 +1,53 @@
+"""Tests for InstrumentCommunicator.read_binary_block with fake instruments"""
+
+import pytest
+
+pytest.importorskip("PySide6")
+constants = pytest.importorskip("pyvisa.constants")
+
+from PythonScreenShot import InstrumentCommunicator
+
+StatusCode = constants.StatusCode
+
+
+class FakeInstrument:
+    """Replays a reply, asserting END with its last byte like a real session"""
+
+    def __init__(self, reply: bytes):
+        self.reply = reply
+        self.written = []
+        self.last_status = StatusCode.success
+
+    def write(self, command):
+        self.written.append(command)
+
+    def _take(self, count):
+        if not self.reply:
+            # a real session would block until the timeout here
+            raise TimeoutError("read past the end of the reply")
+        data, self.reply = self.reply[:count], self.reply[count:]
+        self.last_status = StatusCode.success if not self.reply else StatusCode.success_max_count_read
+        return data
+
+    def read_bytes(self, count):
+        return self._take(count)
+
+    def read_raw(self):
+        return self._take(len(self.reply))
+
+
+def test_block_without_terminator():
+    instr = FakeInstrument(b'#14\x89PNG')
+    assert InstrumentCommunicator.read_binary_block(instr, ':DISP:DATA?') == b'\x89PNG'
+    assert instr.written == [':DISP:DATA?']
+
+
+def test_block_with_crlf_terminator():
+    instr = FakeInstrument(b'#14\x89PNG\r\n')
+    assert InstrumentCommunicator.read_binary_block(instr, ':DISP:DATA?') == b'\x89PNG'
+    assert instr.reply == b''
+
+
+def test_invalid_header():
+    with pytest.raises(ValueError):
+        InstrumentCommunicator.read_binary_block(FakeInstrument(b'ERR\n'), ':DISP:DATA?')